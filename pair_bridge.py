@@ -13,21 +13,23 @@ Example:
 """
 
 import asyncio
+import ipaddress
 import sys
 import os
 from pathlib import Path
 
-try:
-    from pylutron_caseta.pairing import async_pair
-except ImportError:
-    print("Error: pylutron_caseta not installed.")
-    print("Run: pip install pylutron-caseta")
-    sys.exit(1)
+from pylutron_caseta.pairing import async_pair
 
 
 CERT_DIR = Path(__file__).parent / "lutron_certs"
 
 
+def _write_all(files: list[tuple[Path, str]]) -> None:
+    """Write each (path, contents) pair to disk."""
+    for path, contents in files:
+        path.write_text(contents)
+
+
 async def pair_with_bridge(bridge_ip: str) -> None:
     """Pair with the Lutron bridge and save certificates."""
 
@@ -47,19 +49,13 @@ async def pair_with_bridge(bridge_ip: str) -> None:
     try:
         data = await async_pair(bridge_ip)
 
-        # Save certificates
-        with open(cert_path, "w") as f:
-            f.write(data["cert"])
-
-        with open(key_path, "w") as f:
-            f.write(data["key"])
-
-        with open(ca_path, "w") as f:
-            f.write(data["ca"])
-
-        # Save bridge IP for convenience
-        with open(CERT_DIR / "bridge_ip.txt", "w") as f:
-            f.write(bridge_ip)
+        # Save certificates, plus the bridge IP for convenience
+        await asyncio.to_thread(_write_all, [
+            (cert_path, data["cert"]),
+            (key_path, data["key"]),
+            (ca_path, data["ca"]),
+            (CERT_DIR / "bridge_ip.txt", bridge_ip),
+        ])
 
         print("\n" + "=" * 50)
         print("  PAIRING SUCCESSFUL!")
@@ -90,9 +86,10 @@ def main():
 
     bridge_ip = sys.argv[1]
 
-    # Validate IP format (basic check)
-    parts = bridge_ip.split(".")
-    if len(parts) != 4:
+    # The bridge is reached over IPv4 only
+    try:
+        ipaddress.IPv4Address(bridge_ip)
+    except ValueError:
         print(f"Error: Invalid IP address: {bridge_ip}")
         sys.exit(1)
 
@@ -12,69 +12,245 @@ Environment Variables:
 
 import asyncio
 import os
+import socket
+import ssl
 import sys
-import json
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, NamedTuple
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
-
-try:
-    from pylutron_caseta.smartbridge import Smartbridge
-except ImportError:
-    print("Error: pylutron_caseta not installed", file=sys.stderr)
-    print("Run: pip install pylutron-caseta", file=sys.stderr)
-    sys.exit(1)
+from pylutron_caseta.leap import open_connection
+from pylutron_caseta.smartbridge import LEAP_PORT, Smartbridge
 
 
 # Configuration
 CERT_DIR = Path(os.environ.get("LUTRON_CERT_DIR", Path(__file__).parent / "lutron_certs"))
 BRIDGE_IP = os.environ.get("LUTRON_BRIDGE_IP", "")
 
+# Fall back to the bridge IP saved by pair_bridge.py
+if not BRIDGE_IP:
+    _ip_file = CERT_DIR / "bridge_ip.txt"
+    if _ip_file.exists():
+        BRIDGE_IP = _ip_file.read_text().strip()
+
+CERT_PATH = CERT_DIR / "caseta.crt"
+KEY_PATH = CERT_DIR / "caseta.key"
+CA_PATH = CERT_DIR / "caseta-bridge.crt"
+_CERT_PATH_STR = str(CERT_PATH)
+_KEY_PATH_STR = str(KEY_PATH)
+_CA_PATH_STR = str(CA_PATH)
+
+# How long the device/scene name indexes are reused before being rebuilt
+CACHE_TTL = 1.0
+
+# How often the background task checks (and restores) the bridge connection
+KEEPALIVE_INTERVAL = 30.0
+
+# Most commands in flight to the bridge at once
+BRIDGE_CONCURRENCY = 8
+
 # Global bridge connection
 bridge: Smartbridge | None = None
+_bridge_lock = asyncio.Lock()
+_BRIDGE_SEM = asyncio.Semaphore(BRIDGE_CONCURRENCY)
 server = Server("lutron-caseta")
 
+# TLS context built from the pairing certificates, shared by every reconnect
+_ssl_ctx: ssl.SSLContext | None = None
+
+
+class _Lookup(NamedTuple):
+    """A live device or scene dict with name indexes built over it."""
+
+    items: dict
+    name_index: dict[str, str]  # lowercase name -> first id using it
+    lower_names: list[tuple[str, str]]  # (id, lowercase name), in order
+    display_names: dict[str, str]  # id -> name shown in responses
+
+
+# Name indexes per slot ("devices" or "scenes"): (bridge, timestamp, lookup)
+_lookup_cache: dict[str, tuple[Smartbridge, float, _Lookup]] = {}
+
+# Rendered list_devices output: ((lookup, live state), text)
+_device_list_cache: tuple[tuple, str] | None = None
+
+# Rendered get_device_state output: device id -> ((lookup, live state), text)
+_state_json_cache: dict[str, tuple[tuple, str]] = {}
+
 
 async def get_bridge() -> Smartbridge:
     """Get or create the bridge connection."""
-    global bridge, BRIDGE_IP
-
     if bridge is not None and bridge.is_connected():
         return bridge
 
-    # Try to load bridge IP from saved file if not set
-    if not BRIDGE_IP:
-        ip_file = CERT_DIR / "bridge_ip.txt"
-        if ip_file.exists():
-            BRIDGE_IP = ip_file.read_text().strip()
+    # Only one caller (re)connects; the rest wait for it to finish
+    async with _bridge_lock:
+        if bridge is not None and bridge.is_connected():
+            return bridge
+        return await _connect_bridge()
+
+
+async def _connect_bridge() -> Smartbridge:
+    """Replace any stale bridge with a freshly connected one."""
+    global bridge
+
+    if bridge is not None:
+        # Stop the old bridge's reconnect loop before replacing it
+        await bridge.close()
+        bridge = None
+
+    ssl_ctx = await _get_ssl_ctx()
+
+    async def _connect():
+        # Same connection Smartbridge.create_tls makes, minus reloading the certs
+        return await open_connection(
+            BRIDGE_IP,
+            LEAP_PORT,
+            server_hostname="",
+            ssl=ssl_ctx,
+            family=socket.AF_INET,
+        )
+
+    bridge = Smartbridge(_connect)
+
+    await bridge.connect()
+    return bridge
+
 
+def _create_ssl_ctx(keyfile: str, certfile: str, ca_certs: str) -> ssl.SSLContext:
+    """Build the client TLS context for the bridge (blocking disk I/O)."""
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    ctx.load_verify_locations(ca_certs)
+    ctx.load_cert_chain(certfile, keyfile)
+    ctx.verify_mode = ssl.CERT_REQUIRED
+    return ctx
+
+
+async def _get_ssl_ctx() -> ssl.SSLContext:
+    """Load the TLS context once and reuse it for every connection."""
+    global _ssl_ctx
+
+    if _ssl_ctx is None:
+        _ssl_ctx = await asyncio.to_thread(
+            _create_ssl_ctx, _KEY_PATH_STR, _CERT_PATH_STR, _CA_PATH_STR
+        )
+    return _ssl_ctx
+
+
+def check_config() -> None:
+    """Fail fast if the server hasn't been paired with a bridge."""
     if not BRIDGE_IP:
         raise RuntimeError(
             "Bridge IP not configured. Set LUTRON_BRIDGE_IP environment variable "
             "or run pair_bridge.py first."
         )
 
-    cert_path = CERT_DIR / "caseta.crt"
-    key_path = CERT_DIR / "caseta.key"
-    ca_path = CERT_DIR / "caseta-bridge.crt"
-
-    if not all(p.exists() for p in [cert_path, key_path, ca_path]):
+    if not all(p.exists() for p in [CERT_PATH, KEY_PATH, CA_PATH]):
         raise RuntimeError(
             f"Certificates not found in {CERT_DIR}. Run pair_bridge.py first."
         )
 
-    bridge = Smartbridge.create_tls(
-        hostname=BRIDGE_IP,
-        keyfile=str(key_path),
-        certfile=str(cert_path),
-        ca_certs=str(ca_path),
-    )
 
-    await bridge.connect()
-    return bridge
+async def _keepalive() -> None:
+    """Connect at startup, then keep the bridge connection alive."""
+    while True:
+        try:
+            await get_bridge()
+        except Exception as e:
+            print(f"Bridge connection failed: {e}", file=sys.stderr)
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+
+
+def _build_lookup(items: dict) -> _Lookup:
+    """Precompute names for lookups and messages."""
+    index: dict[str, str] = {}
+    lower_names: list[tuple[str, str]] = []
+    display_names: dict[str, str] = {}
+    for item_id, item in items.items():
+        display_name = item.get("name") or ""
+        name = display_name.lower()
+        if name:
+            index.setdefault(name, item_id)
+        lower_names.append((item_id, name))
+        display_names[item_id] = display_name or item_id
+    return _Lookup(items, index, lower_names, display_names)
+
+
+def _cached(b: Smartbridge, getter: Callable[[], dict], slot: str) -> _Lookup:
+    """Return getter()'s dict with name indexes rebuilt at most every CACHE_TTL."""
+    now = time.monotonic()
+    cached = _lookup_cache.get(slot)
+    if cached is not None:
+        cached_bridge, ts, lookup = cached
+        if cached_bridge is b and now - ts < CACHE_TTL:
+            return lookup
+
+    lookup = _build_lookup(getter())
+    _lookup_cache[slot] = (b, now, lookup)
+    return lookup
+
+
+async def _limited(command: Awaitable[Any]) -> Any:
+    """Run a bridge command without exceeding BRIDGE_CONCURRENCY."""
+    async with _BRIDGE_SEM:
+        return await command
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result as indented JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _live_state(device: dict) -> tuple:
+    """Fields the bridge updates in place as device status changes."""
+    return device.get("current_state"), device.get("fan_speed")
+
+
+def _device_list_text(devices: _Lookup) -> str:
+    """Render list_devices output, reusing it while nothing has changed."""
+    global _device_list_cache
+
+    # The bridge mutates device dicts in place, so the live state is part of
+    # the key; otherwise a level change wouldn't show until the cache expired
+    key = (devices, tuple(_live_state(d) for d in devices.items.values()))
+    if _device_list_cache is not None:
+        cached_key, text = _device_list_cache
+        if cached_key[0] is key[0] and cached_key[1] == key[1]:
+            return text
+
+    result = []
+    for device_id, device in devices.items.items():
+        # Skip non-controllable devices
+        if device.get("type") in ["SmartBridge", "Unknown"]:
+            continue
+        result.append(format_device_info(device_id, device))
+
+    if result:
+        text = _dumps(result)
+    else:
+        text = "No controllable devices found."
+
+    _device_list_cache = (key, text)
+    return text
+
+
+def _device_state_text(devices: _Lookup, device_id: str, device: dict) -> str:
+    """Render get_device_state output, reusing it while nothing has changed."""
+    key = (devices, _live_state(device))
+    cached = _state_json_cache.get(device_id)
+    if cached is not None:
+        cached_key, text = cached
+        if cached_key[0] is key[0] and cached_key[1] == key[1]:
+            return text
+
+    text = _dumps(format_device_info(device_id, device))
+    _state_json_cache[device_id] = (key, text)
+    return text
 
 
 def format_device_info(device_id: str, device: dict) -> dict:
@@ -91,280 +267,294 @@ def format_device_info(device_id: str, device: dict) -> dict:
     }
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Lutron control tools."""
-    return [
-        Tool(
-            name="list_devices",
-            description="List all Lutron devices (lights, dimmers, switches, fans) with their current states",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="turn_on",
-            description="Turn on a light or switch. Use the device name or ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device": {
-                        "type": "string",
-                        "description": "Device name or ID to turn on",
-                    },
+# Tool definitions never change, so build them once
+_TOOLS = [
+    Tool(
+        name="list_devices",
+        description="List all Lutron devices (lights, dimmers, switches, fans) with their current states",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="turn_on",
+        description="Turn on a light or switch. Use the device name or ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device": {
+                    "type": "string",
+                    "description": "Device name or ID to turn on",
                 },
-                "required": ["device"],
             },
-        ),
-        Tool(
-            name="turn_off",
-            description="Turn off a light or switch. Use the device name or ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device": {
-                        "type": "string",
-                        "description": "Device name or ID to turn off",
-                    },
+            "required": ["device"],
+        },
+    ),
+    Tool(
+        name="turn_off",
+        description="Turn off a light or switch. Use the device name or ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device": {
+                    "type": "string",
+                    "description": "Device name or ID to turn off",
                 },
-                "required": ["device"],
             },
-        ),
-        Tool(
-            name="set_brightness",
-            description="Set brightness level for a dimmer (0-100). 0 is off, 100 is full brightness.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device": {
-                        "type": "string",
-                        "description": "Device name or ID",
-                    },
-                    "brightness": {
-                        "type": "integer",
-                        "description": "Brightness level (0-100)",
-                        "minimum": 0,
-                        "maximum": 100,
-                    },
+            "required": ["device"],
+        },
+    ),
+    Tool(
+        name="set_brightness",
+        description="Set brightness level for a dimmer (0-100). 0 is off, 100 is full brightness.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device": {
+                    "type": "string",
+                    "description": "Device name or ID",
                 },
-                "required": ["device", "brightness"],
-            },
-        ),
-        Tool(
-            name="get_device_state",
-            description="Get the current state of a specific device",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device": {
-                        "type": "string",
-                        "description": "Device name or ID",
-                    },
+                "brightness": {
+                    "type": "integer",
+                    "description": "Brightness level (0-100)",
+                    "minimum": 0,
+                    "maximum": 100,
                 },
-                "required": ["device"],
             },
-        ),
-        Tool(
-            name="list_scenes",
-            description="List all available Lutron scenes",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
+            "required": ["device", "brightness"],
+        },
+    ),
+    Tool(
+        name="get_device_state",
+        description="Get the current state of a specific device",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device": {
+                    "type": "string",
+                    "description": "Device name or ID",
+                },
             },
-        ),
-        Tool(
-            name="activate_scene",
-            description="Activate a Lutron scene by name or ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene": {
-                        "type": "string",
-                        "description": "Scene name or ID to activate",
-                    },
+            "required": ["device"],
+        },
+    ),
+    Tool(
+        name="list_scenes",
+        description="List all available Lutron scenes",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="activate_scene",
+        description="Activate a Lutron scene by name or ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene": {
+                    "type": "string",
+                    "description": "Scene name or ID to activate",
                 },
-                "required": ["scene"],
             },
-        ),
-    ]
+            "required": ["scene"],
+        },
+    ),
+]
 
 
-def find_device(devices: dict, search: str) -> tuple[str, dict] | None:
-    """Find a device by name or ID."""
-    search_lower = search.lower()
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Lutron control tools."""
+    return _TOOLS
 
+
+def find_device(devices: _Lookup, search: str) -> tuple[str, dict, str] | None:
+    """Find a device by name or ID."""
     # Try exact ID match first
-    if search in devices:
-        return search, devices[search]
+    if search in devices.items:
+        return search, devices.items[search], devices.display_names.get(search, search)
 
     # Try name match (case-insensitive)
-    for device_id, device in devices.items():
-        if device.get("name", "").lower() == search_lower:
-            return device_id, device
+    search_lower = search.lower()
+    device_id = devices.name_index.get(search_lower)
+    if device_id is not None:
+        return device_id, devices.items[device_id], devices.display_names[device_id]
 
     # Try partial name match
-    for device_id, device in devices.items():
-        if search_lower in device.get("name", "").lower():
-            return device_id, device
+    for device_id, name in devices.lower_names:
+        if search_lower in name:
+            return device_id, devices.items[device_id], devices.display_names[device_id]
 
     return None
 
 
-def find_scene(scenes: dict, search: str) -> tuple[str, dict] | None:
+def find_scene(scenes: _Lookup, search: str) -> tuple[str, dict, str] | None:
     """Find a scene by name or ID."""
-    search_lower = search.lower()
-
     # Try exact ID match first
-    if search in scenes:
-        return search, scenes[search]
+    if search in scenes.items:
+        return search, scenes.items[search], scenes.display_names.get(search, search)
 
     # Try name match (case-insensitive)
-    for scene_id, scene in scenes.items():
-        if scene.get("name", "").lower() == search_lower:
-            return scene_id, scene
+    search_lower = search.lower()
+    scene_id = scenes.name_index.get(search_lower)
+    if scene_id is not None:
+        return scene_id, scenes.items[scene_id], scenes.display_names[scene_id]
 
     # Try partial name match
-    for scene_id, scene in scenes.items():
-        if search_lower in scene.get("name", "").lower():
-            return scene_id, scene
+    for scene_id, name in scenes.lower_names:
+        if search_lower in name:
+            return scene_id, scenes.items[scene_id], scenes.display_names[scene_id]
 
     return None
 
 
+async def _resolve_device(b: Smartbridge, search: str) -> tuple[str, dict, str] | None:
+    """Find a device on the bridge by name or ID."""
+    return find_device(_cached(b, b.get_devices, "devices"), search)
+
+
+async def _resolve_scene(b: Smartbridge, search: str) -> tuple[str, dict, str] | None:
+    """Find a scene on the bridge by name or ID."""
+    return find_scene(_cached(b, b.get_scenes, "scenes"), search)
+
+
+def _device_not_found(search: str) -> list[TextContent]:
+    """Response for a device search with no match."""
+    return [TextContent(
+        type="text",
+        text=f"Device not found: {search}"
+    )]
+
+
+async def _tool_list_devices(b: Smartbridge, arguments: dict[str, Any]) -> list[TextContent]:
+    """List controllable devices with their current states."""
+    devices = _cached(b, b.get_devices, "devices")
+    return [TextContent(type="text", text=_device_list_text(devices))]
+
+
+async def _tool_turn_on(b: Smartbridge, arguments: dict[str, Any]) -> list[TextContent]:
+    """Turn on a device by name or ID."""
+    found = await _resolve_device(b, arguments["device"])
+    if not found:
+        return _device_not_found(arguments["device"])
+
+    device_id, _, display_name = found
+    await _limited(b.turn_on(device_id))
+
+    return [TextContent(
+        type="text",
+        text=f"Turned on: {display_name}"
+    )]
+
+
+async def _tool_turn_off(b: Smartbridge, arguments: dict[str, Any]) -> list[TextContent]:
+    """Turn off a device by name or ID."""
+    found = await _resolve_device(b, arguments["device"])
+    if not found:
+        return _device_not_found(arguments["device"])
+
+    device_id, _, display_name = found
+    await _limited(b.turn_off(device_id))
+
+    return [TextContent(
+        type="text",
+        text=f"Turned off: {display_name}"
+    )]
+
+
+async def _tool_set_brightness(b: Smartbridge, arguments: dict[str, Any]) -> list[TextContent]:
+    """Set a dimmer's brightness by name or ID."""
+    found = await _resolve_device(b, arguments["device"])
+    if not found:
+        return _device_not_found(arguments["device"])
+
+    device_id, _, display_name = found
+    brightness = max(0, min(100, arguments["brightness"]))
+    await _limited(b.set_value(device_id, brightness))
+
+    return [TextContent(
+        type="text",
+        text=f"Set {display_name} to {brightness}%"
+    )]
+
+
+async def _tool_get_device_state(b: Smartbridge, arguments: dict[str, Any]) -> list[TextContent]:
+    """Get the current state of a device by name or ID."""
+    devices = _cached(b, b.get_devices, "devices")
+    found = find_device(devices, arguments["device"])
+    if not found:
+        return _device_not_found(arguments["device"])
+
+    device_id, device, _ = found
+    return [TextContent(
+        type="text",
+        text=_device_state_text(devices, device_id, device)
+    )]
+
+
+async def _tool_list_scenes(b: Smartbridge, arguments: dict[str, Any]) -> list[TextContent]:
+    """List the scenes defined on the bridge."""
+    scenes = b.get_scenes()
+    result = []
+    for scene_id, scene in scenes.items():
+        result.append({
+            "id": scene_id,
+            "name": scene.get("name", "Unknown"),
+        })
+
+    if not result:
+        return [TextContent(type="text", text="No scenes found.")]
+
+    return [TextContent(
+        type="text",
+        text=_dumps(result)
+    )]
+
+
+async def _tool_activate_scene(b: Smartbridge, arguments: dict[str, Any]) -> list[TextContent]:
+    """Activate a scene by name or ID."""
+    found = await _resolve_scene(b, arguments["scene"])
+    if not found:
+        return [TextContent(
+            type="text",
+            text=f"Scene not found: {arguments['scene']}"
+        )]
+
+    scene_id, _, display_name = found
+    await _limited(b.activate_scene(scene_id))
+
+    return [TextContent(
+        type="text",
+        text=f"Activated scene: {display_name}"
+    )]
+
+
+# Tool name -> handler(bridge, arguments)
+_HANDLERS = {
+    "list_devices": _tool_list_devices,
+    "turn_on": _tool_turn_on,
+    "turn_off": _tool_turn_off,
+    "set_brightness": _tool_set_brightness,
+    "get_device_state": _tool_get_device_state,
+    "list_scenes": _tool_list_scenes,
+    "activate_scene": _tool_activate_scene,
+}
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
     try:
         b = await get_bridge()
-
-        if name == "list_devices":
-            devices = b.get_devices()
-            result = []
-            for device_id, device in devices.items():
-                # Skip non-controllable devices
-                if device.get("type") in ["SmartBridge", "Unknown"]:
-                    continue
-                result.append(format_device_info(device_id, device))
-
-            if not result:
-                return [TextContent(type="text", text="No controllable devices found.")]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-
-        elif name == "turn_on":
-            devices = b.get_devices()
-            found = find_device(devices, arguments["device"])
-
-            if not found:
-                return [TextContent(
-                    type="text",
-                    text=f"Device not found: {arguments['device']}"
-                )]
-
-            device_id, device = found
-            await b.turn_on(device_id)
-
-            return [TextContent(
-                type="text",
-                text=f"Turned on: {device.get('name', device_id)}"
-            )]
-
-        elif name == "turn_off":
-            devices = b.get_devices()
-            found = find_device(devices, arguments["device"])
-
-            if not found:
-                return [TextContent(
-                    type="text",
-                    text=f"Device not found: {arguments['device']}"
-                )]
-
-            device_id, device = found
-            await b.turn_off(device_id)
-
-            return [TextContent(
-                type="text",
-                text=f"Turned off: {device.get('name', device_id)}"
-            )]
-
-        elif name == "set_brightness":
-            devices = b.get_devices()
-            found = find_device(devices, arguments["device"])
-
-            if not found:
-                return [TextContent(
-                    type="text",
-                    text=f"Device not found: {arguments['device']}"
-                )]
-
-            device_id, device = found
-            brightness = max(0, min(100, arguments["brightness"]))
-            await b.set_value(device_id, brightness)
-
-            return [TextContent(
-                type="text",
-                text=f"Set {device.get('name', device_id)} to {brightness}%"
-            )]
-
-        elif name == "get_device_state":
-            devices = b.get_devices()
-            found = find_device(devices, arguments["device"])
-
-            if not found:
-                return [TextContent(
-                    type="text",
-                    text=f"Device not found: {arguments['device']}"
-                )]
-
-            device_id, device = found
-            return [TextContent(
-                type="text",
-                text=json.dumps(format_device_info(device_id, device), indent=2)
-            )]
-
-        elif name == "list_scenes":
-            scenes = b.get_scenes()
-            result = []
-            for scene_id, scene in scenes.items():
-                result.append({
-                    "id": scene_id,
-                    "name": scene.get("name", "Unknown"),
-                })
-
-            if not result:
-                return [TextContent(type="text", text="No scenes found.")]
-
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-
-        elif name == "activate_scene":
-            scenes = b.get_scenes()
-            found = find_scene(scenes, arguments["scene"])
-
-            if not found:
-                return [TextContent(
-                    type="text",
-                    text=f"Scene not found: {arguments['scene']}"
-                )]
-
-            scene_id, scene = found
-            await b.activate_scene(scene_id)
-
-            return [TextContent(
-                type="text",
-                text=f"Activated scene: {scene.get('name', scene_id)}"
-            )]
-
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(b, arguments)
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -372,9 +562,22 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    check_config()
+
+    # Connect in the background so tool calls don't pay for the TLS handshake
+    keepalive = asyncio.create_task(_keepalive())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        keepalive.cancel()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv event loop when it's available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())